@@ -6,11 +6,23 @@ A command-line tool for deploying, listing, and deleting SageMaker JumpStart mod
 """
 
 import argparse
+import asyncio
+import copy
+import datetime
+import functools
 import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
-import sagemaker
-from sagemaker.jumpstart.model import JumpStartModel
+from botocore.config import Config
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +36,172 @@ DEFAULT_ROLE = "arn:aws:iam::548692878254:role/service-role/AmazonSageMaker-Exec
 DEFAULT_MODEL_ID = "huggingface-llm-mistral-7b-v3"
 DEFAULT_MODEL_VERSION = "*"
 DEFAULT_INSTANCE_TYPE = "ml.g5.2xlarge"
+LIST_PAGE_SIZE = 100  # MaxResults per list_models/list_endpoints call
+MAX_DELETE_WORKERS = 8
+SAGEMAKER_MAX_POOL_CONNECTIONS = 32
+ENDPOINT_WAITER_DELAY = 30  # seconds between describe_endpoint polls
+ENDPOINT_WAITER_MAX_ATTEMPTS = 60
+ENDPOINT_ROW_TEMPLATE = "{:<50} {:<15} {:%Y-%m-%d %H:%M:%S}"
+MODEL_ROW_TEMPLATE = "{:<50} {:%Y-%m-%d %H:%M:%S}"
+LIST_CACHE_TTL = 30  # seconds list_deployed_models results are reused
+ENDPOINT_STATUSES = [
+    "OutOfService",
+    "Creating",
+    "Updating",
+    "SystemUpdating",
+    "RollingBack",
+    "InService",
+    "Deleting",
+    "Failed",
+    "UpdateRollbackFailed",
+]
+
+
+def _client_config(config_class=Config):
+    """Build the connection, retry and timeout settings for SageMaker clients."""
+    return config_class(
+        # Must cover the concurrent requests of listing/deleting: up to
+        # MAX_DELETE_WORKERS model deletes, or 2 per endpoint in bulk deletes
+        max_pool_connections=SAGEMAKER_MAX_POOL_CONNECTIONS,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=60,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _sagemaker_client():
+    """Return a SageMaker client shared across calls in this process."""
+    return boto3.client("sagemaker", config=_client_config())
+
+
+def _aioboto3_client():
+    """Return an async SageMaker client context manager, or None.
+
+    aioboto3 is optional and imported lazily, so commands that never use
+    it do not pay its import cost. None means it is not installed.
+    """
+    try:
+        import aioboto3
+        from aiobotocore.config import AioConfig
+    except ImportError:
+        return None
+    
+    return aioboto3.Session().client("sagemaker", config=_client_config(AioConfig))
+
+
+@functools.lru_cache(maxsize=None)
+def _sagemaker_session():
+    """Return a SageMaker SDK session shared across deployments.
+
+    Reusing one session keeps the SDK's in-process JumpStart metadata cache
+    warm, so repeat deployments skip the S3 manifest and spec downloads.
+    """
+    import sagemaker
+    
+    return sagemaker.Session(sagemaker_client=_sagemaker_client())
+
+
+def _ttl_cache(ttl):
+    """Cache a function's results per argument set for ``ttl`` seconds.
+
+    Each call receives its own deep copy of the cached result, so callers
+    may mutate what they get back. The wrapped function gains a
+    ``cache_clear()`` method, like ``functools.lru_cache``.
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+        # Bumped by cache_clear() so a call that was already running when the
+        # cache was cleared does not store its now-stale result
+        generation = [0]
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    return copy.deepcopy(entry[1])
+                call_generation = generation[0]
+            
+            result = func(*args, **kwargs)
+            
+            with lock:
+                if generation[0] != call_generation:
+                    return result
+                now = time.monotonic()
+                for stale_key in [k for k, (stamp, _) in cache.items() if now - stamp >= ttl]:
+                    del cache[stale_key]
+                cache[key] = (now, copy.deepcopy(result))
+            return result
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+                generation[0] += 1
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _jumpstart_model_specs(model_id, model_version):
+    """Return the JumpStart specs for a model, cached per process.
+
+    Returns None if the model ID is not a known open-weights or
+    proprietary JumpStart model.
+    """
+    from sagemaker.jumpstart.accessors import JumpStartModelsAccessor
+    from sagemaker.jumpstart.utils import validate_model_id_and_get_type
+    
+    sagemaker_session = _sagemaker_session()
+    # Resolve the model type the same way JumpStartModel does, so
+    # proprietary and marketplace models are looked up in their own manifest
+    model_type = validate_model_id_and_get_type(
+        model_id=model_id,
+        region=sagemaker_session.boto_region_name,
+        model_version=model_version,
+        sagemaker_session=sagemaker_session,
+    )
+    if model_type is None:
+        return None
+    
+    return JumpStartModelsAccessor.get_model_specs(
+        region=sagemaker_session.boto_region_name,
+        model_id=model_id,
+        version=model_version,
+        s3_client=sagemaker_session.s3_client,
+        model_type=model_type,
+    )
+
+
+def validate_deployment(model_id, model_version, instance_type):
+    """Check a model ID and instance type against JumpStart metadata.
+
+    Raises ValueError before any AWS resources are created if the model is
+    unknown or does not support the requested instance type. If the specs
+    for a known model cannot be loaded, the instance type check is skipped
+    and the deployment is left to the SDK.
+    """
+    try:
+        specs = _jumpstart_model_specs(model_id, model_version)
+    except KeyError as e:
+        logger.warning(f"Could not load JumpStart specs for {model_id}, skipping validation: {str(e)}")
+        return
+    
+    if specs is None:
+        raise ValueError(f"Unknown JumpStart model {model_id} (version {model_version})")
+    
+    supported_instance_types = getattr(specs, "supported_inference_instance_types", None)
+    if supported_instance_types and instance_type not in supported_instance_types:
+        raise ValueError(
+            f"Instance type {instance_type} is not supported by model {model_id}. "
+            f"Supported instance types: {', '.join(supported_instance_types)}"
+        )
 
 
 def deploy_model(
@@ -35,21 +213,35 @@ def deploy_model(
     wait=False,
 ):
     """Deploy a JumpStart model to a SageMaker endpoint."""
+    # Imported lazily: the SageMaker SDK is slow to import and only needed here
+    from sagemaker.jumpstart.model import JumpStartModel
+    
     logger.info(f"Deploying model {model_id} (version {model_version}) on {instance_type}")
+    validate_deployment(model_id, model_version, instance_type)
     
     model = JumpStartModel(
         model_id=model_id,
         model_version=model_version,
         role=role,
+        sagemaker_session=_sagemaker_session(),
     )
     
     predictor = model.deploy(
         accept_eula=accept_eula,
         instance_type=instance_type,
-        wait=wait,
+        wait=False,
     )
+    list_deployed_models.cache_clear()
     
     if wait:
+        logger.info(f"Waiting for endpoint {predictor.endpoint_name} to be InService")
+        _sagemaker_client().get_waiter("endpoint_in_service").wait(
+            EndpointName=predictor.endpoint_name,
+            WaiterConfig={
+                "Delay": ENDPOINT_WAITER_DELAY,
+                "MaxAttempts": ENDPOINT_WAITER_MAX_ATTEMPTS,
+            },
+        )
         logger.info(f"Successfully deployed model to endpoint: {predictor.endpoint_name}")
     else:
         logger.info(f"Started deployment of model to endpoint: {predictor.endpoint_name}")
@@ -58,65 +250,171 @@ def deploy_model(
     return predictor
 
 
-def list_deployed_models():
-    """List all SageMaker models and endpoints."""
-    sagemaker_client = boto3.client("sagemaker")
-    
-    # Get all models
+def _list_filters(name_contains=None, status_equals=None, creation_time_after=None):
+    """Build the server-side filter arguments for the SageMaker list APIs."""
+    filters = (
+        ("NameContains", name_contains),
+        ("StatusEquals", status_equals),
+        ("CreationTimeAfter", creation_time_after),
+    )
+    return {key: value for key, value in filters if value is not None}
+
+
+def iter_models(name_contains=None, creation_time_after=None):
+    """Yield SageMaker models one at a time as each page is retrieved."""
     logger.info("Retrieving all SageMaker models")
-    models_response = sagemaker_client.list_models()
-    
-    # Handle pagination for models
-    all_models = models_response.copy()
-    while "NextToken" in models_response:
-        models_response = sagemaker_client.list_models(NextToken=models_response["NextToken"])
-        all_models["Models"].extend(models_response["Models"])
-        
-    # Get all endpoints
+    model_pages = _sagemaker_client().get_paginator("list_models").paginate(
+        **_list_filters(name_contains=name_contains, creation_time_after=creation_time_after),
+        PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+    )
+    (models,) = model_pages.result_key_iters()
+    yield from models
+
+
+def iter_endpoints(name_contains=None, status_equals=None, creation_time_after=None):
+    """Yield SageMaker endpoints one at a time as each page is retrieved."""
     logger.info("Retrieving all SageMaker endpoints")
-    endpoints_response = sagemaker_client.list_endpoints()
+    endpoint_pages = _sagemaker_client().get_paginator("list_endpoints").paginate(
+        **_list_filters(name_contains, status_equals, creation_time_after),
+        PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+    )
+    (endpoints,) = endpoint_pages.result_key_iters()
+    yield from endpoints
+
+
+def _fetch_all_models(**filters):
+    """Retrieve every SageMaker model, following pagination."""
+    return {"Models": list(iter_models(**filters))}
+
+
+def _fetch_all_endpoints(**filters):
+    """Retrieve every SageMaker endpoint, following pagination."""
+    return {"Endpoints": list(iter_endpoints(**filters))}
+
+
+@_ttl_cache(LIST_CACHE_TTL)
+def list_deployed_models(
+    include_models=True,
+    include_endpoints=True,
+    name_contains=None,
+    status_equals=None,
+    creation_time_after=None,
+):
+    """List all SageMaker models and endpoints.
+
+    Models and endpoints are fetched concurrently. A side that is not
+    requested is skipped entirely and returned as an empty list. The
+    optional filters are applied server-side; ``status_equals`` only
+    applies to endpoints, since models have no status. Results
+    are cached for ``LIST_CACHE_TTL`` seconds and invalidated by deploys
+    and deletes.
+    """
+    all_models = {"Models": []}
+    all_endpoints = {"Endpoints": []}
     
-    # Handle pagination for endpoints
-    all_endpoints = endpoints_response.copy()
-    while "NextToken" in endpoints_response:
-        endpoints_response = sagemaker_client.list_endpoints(
-            NextToken=endpoints_response["NextToken"]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        models_future = (
+            executor.submit(
+                _fetch_all_models,
+                name_contains=name_contains,
+                creation_time_after=creation_time_after,
+            )
+            if include_models
+            else None
         )
-        all_endpoints["Endpoints"].extend(endpoints_response["Endpoints"])
+        endpoints_future = (
+            executor.submit(
+                _fetch_all_endpoints,
+                name_contains=name_contains,
+                status_equals=status_equals,
+                creation_time_after=creation_time_after,
+            )
+            if include_endpoints
+            else None
+        )
+        
+        if models_future is not None:
+            all_models = models_future.result()
+        if endpoints_future is not None:
+            all_endpoints = endpoints_future.result()
     
     return all_models, all_endpoints
 
 
+def _delete_models(sagemaker_client, model_names, max_workers=MAX_DELETE_WORKERS):
+    """Delete models concurrently and return the names that failed."""
+    
+    def delete_one(model_name):
+        logger.info(f"Deleting model: {model_name}")
+        try:
+            sagemaker_client.delete_model(ModelName=model_name)
+            return None
+        except Exception as e:
+            logger.error(f"Error deleting model {model_name}: {str(e)}")
+            return model_name
+    
+    if max_workers == 1:
+        results = [delete_one(model_name) for model_name in model_names]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(model_names))) as executor:
+            results = list(executor.map(delete_one, model_names))
+    
+    return [model_name for model_name in results if model_name is not None]
+
+
 def delete_deployed_model(endpoint_name, delete_model=True):
     """Delete a SageMaker endpoint and optionally its model."""
-    sagemaker_client = boto3.client("sagemaker")
-    
+    return _delete_endpoint(_sagemaker_client(), endpoint_name, delete_model)
+
+
+def _delete_endpoint(
+    sagemaker_client, endpoint_name, delete_model, model_workers=MAX_DELETE_WORKERS
+):
+    """Delete an endpoint, its config and optionally its models.
+
+    ``model_workers`` bounds how many model deletes run at once; bulk
+    deletes pass 1 so the total number of in-flight requests stays within
+    the client's connection pool.
+    """
     try:
         logger.info(f"Retrieving details for endpoint: {endpoint_name}")
         endpoint_details = sagemaker_client.describe_endpoint(EndpointName=endpoint_name)
         endpoint_config_name = endpoint_details["EndpointConfigName"]
         
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # The endpoint delete does not depend on its config, so start it
+            # while the config is being described
+            logger.info(f"Deleting endpoint: {endpoint_name}")
+            delete_endpoint_future = executor.submit(
+                sagemaker_client.delete_endpoint, EndpointName=endpoint_name
+            )
+            endpoint_config_future = executor.submit(
+                sagemaker_client.describe_endpoint_config,
+                EndpointConfigName=endpoint_config_name,
+            )
+            
+            # Only delete the config and models once the endpoint is gone
+            delete_endpoint_future.result()
+            endpoint_config = endpoint_config_future.result()
+        
         # Get model names from the endpoint config
-        endpoint_config = sagemaker_client.describe_endpoint_config(
-            EndpointConfigName=endpoint_config_name
-        )
         model_names = [
             variant["ModelName"] for variant in endpoint_config["ProductionVariants"]
         ]
         
-        # Delete endpoint
-        logger.info(f"Deleting endpoint: {endpoint_name}")
-        sagemaker_client.delete_endpoint(EndpointName=endpoint_name)
-        
         # Delete endpoint configuration
         logger.info(f"Deleting endpoint configuration: {endpoint_config_name}")
         sagemaker_client.delete_endpoint_config(EndpointConfigName=endpoint_config_name)
         
         # Delete models if requested
-        if delete_model:
-            for model_name in model_names:
-                logger.info(f"Deleting model: {model_name}")
-                sagemaker_client.delete_model(ModelName=model_name)
+        failed_models = []
+        if delete_model and model_names:
+            failed_models = _delete_models(sagemaker_client, model_names, model_workers)
+        
+        list_deployed_models.cache_clear()
+        
+        if failed_models:
+            return False
         
         return True
     except Exception as e:
@@ -124,34 +422,250 @@ def delete_deployed_model(endpoint_name, delete_model=True):
         return False
 
 
-def print_endpoint_list(endpoints):
-    """Print formatted endpoint information."""
-    if not endpoints.get("Endpoints"):
-        print("No endpoints found.")
-        return
-        
-    print("\nSageMaker Endpoints:")
-    print("=" * 80)
-    print(f"{'Endpoint Name':<50} {'Status':<15} {'Created':<20}")
-    print("-" * 80)
+def delete_deployed_models(endpoint_names, delete_model=True, max_workers=MAX_DELETE_WORKERS):
+    """Delete several SageMaker endpoints concurrently.
+
+    Returns a dict mapping each endpoint name to whether its deletion
+    succeeded. Each endpoint keeps at most two requests in flight, so
+    ``max_workers`` is capped at half the client's connection pool.
+    """
+    endpoint_names = list(endpoint_names)
+    if not endpoint_names:
+        return {}
+    
+    sagemaker_client = _sagemaker_client()
+    max_workers = min(max_workers, SAGEMAKER_MAX_POOL_CONNECTIONS // 2, len(endpoint_names))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda endpoint_name: _delete_endpoint(
+                    sagemaker_client, endpoint_name, delete_model, model_workers=1
+                ),
+                endpoint_names,
+            )
+        )
     
-    for endpoint in endpoints["Endpoints"]:
-        print(f"{endpoint['EndpointName']:<50} {endpoint['EndpointStatus']:<15} {endpoint['CreationTime'].strftime('%Y-%m-%d %H:%M:%S')}")
+    return dict(zip(endpoint_names, results))
 
 
-def print_model_list(models):
-    """Print formatted model information."""
-    if not models.get("Models"):
-        print("No models found.")
-        return
+async def _collect_async(paginator, result_key, **filters):
+    """Collect every item under ``result_key`` from an async paginator."""
+    items = []
+    async for page in paginator.paginate(**filters, PaginationConfig={"PageSize": LIST_PAGE_SIZE}):
+        items.extend(page[result_key])
+    return items
+
+
+async def list_deployed_models_async(
+    include_models=True,
+    include_endpoints=True,
+    name_contains=None,
+    status_equals=None,
+    creation_time_after=None,
+):
+    """Async variant of ``list_deployed_models`` built on aioboto3.
+
+    Results are always fetched fresh and never served from the
+    ``list_deployed_models`` cache. Falls back to running
+    ``list_deployed_models`` in a worker thread when aioboto3 is not
+    installed.
+    """
+    client_context = _aioboto3_client()
+    if client_context is None:
+        return await asyncio.to_thread(
+            list_deployed_models.__wrapped__,
+            include_models=include_models,
+            include_endpoints=include_endpoints,
+            name_contains=name_contains,
+            status_equals=status_equals,
+            creation_time_after=creation_time_after,
+        )
+    
+    async def no_items():
+        return []
+    
+    async with client_context as sagemaker_client:
+        logger.info("Retrieving all SageMaker models and endpoints")
+        models, endpoints = await asyncio.gather(
+            _collect_async(
+                sagemaker_client.get_paginator("list_models"),
+                "Models",
+                **_list_filters(name_contains=name_contains, creation_time_after=creation_time_after),
+            )
+            if include_models
+            else no_items(),
+            _collect_async(
+                sagemaker_client.get_paginator("list_endpoints"),
+                "Endpoints",
+                **_list_filters(name_contains, status_equals, creation_time_after),
+            )
+            if include_endpoints
+            else no_items(),
+        )
+    
+    return {"Models": models}, {"Endpoints": endpoints}
+
+
+async def _delete_model_async(sagemaker_client, model_name):
+    """Delete a model, returning its name on failure and None on success."""
+    logger.info(f"Deleting model: {model_name}")
+    try:
+        await sagemaker_client.delete_model(ModelName=model_name)
+        return None
+    except Exception as e:
+        logger.error(f"Error deleting model {model_name}: {str(e)}")
+        return model_name
+
+
+async def _delete_deployed_model_async(sagemaker_client, endpoint_name, delete_model):
+    """Delete an endpoint, its config and optionally its models with one client."""
+    try:
+        logger.info(f"Retrieving details for endpoint: {endpoint_name}")
+        endpoint_details = await sagemaker_client.describe_endpoint(EndpointName=endpoint_name)
+        endpoint_config_name = endpoint_details["EndpointConfigName"]
+        
+        # The endpoint delete does not depend on its config, so run them together
+        logger.info(f"Deleting endpoint: {endpoint_name}")
+        # Wait for both calls even if one fails, so neither outlives the client
+        delete_endpoint_result, endpoint_config = await asyncio.gather(
+            sagemaker_client.delete_endpoint(EndpointName=endpoint_name),
+            sagemaker_client.describe_endpoint_config(EndpointConfigName=endpoint_config_name),
+            return_exceptions=True,
+        )
+        for result in (delete_endpoint_result, endpoint_config):
+            if isinstance(result, BaseException):
+                raise result
+        model_names = [
+            variant["ModelName"] for variant in endpoint_config["ProductionVariants"]
+        ]
+        
+        # Delete endpoint configuration
+        logger.info(f"Deleting endpoint configuration: {endpoint_config_name}")
+        await sagemaker_client.delete_endpoint_config(EndpointConfigName=endpoint_config_name)
+        
+        # Delete models if requested
+        failed_models = []
+        if delete_model and model_names:
+            failed_models = await asyncio.gather(
+                *(_delete_model_async(sagemaker_client, model_name) for model_name in model_names)
+            )
+        
+        list_deployed_models.cache_clear()
+        
+        return not any(failed_models)
+    except Exception as e:
+        logger.error(f"Error deleting endpoint and resources: {str(e)}")
+        return False
+
+
+async def delete_deployed_models_async(
+    endpoint_names, delete_model=True, max_workers=MAX_DELETE_WORKERS
+):
+    """Async variant of ``delete_deployed_models`` built on aioboto3.
+
+    Falls back to running ``delete_deployed_models`` in a worker thread when
+    aioboto3 is not installed.
+    """
+    endpoint_names = list(endpoint_names)
+    client_context = _aioboto3_client()
+    if client_context is None:
+        return await asyncio.to_thread(
+            delete_deployed_models, endpoint_names, delete_model, max_workers
+        )
+    
+    semaphore = asyncio.Semaphore(max_workers)
+    
+    async with client_context as sagemaker_client:
+        async def delete_one(endpoint_name):
+            async with semaphore:
+                return await _delete_deployed_model_async(
+                    sagemaker_client, endpoint_name, delete_model
+                )
         
-    print("\nSageMaker Models:")
-    print("=" * 80)
-    print(f"{'Model Name':<50} {'Created':<20}")
-    print("-" * 80)
+        results = await asyncio.gather(*(delete_one(name) for name in endpoint_names))
     
-    for model in models["Models"]:
-        print(f"{model['ModelName']:<50} {model['CreationTime'].strftime('%Y-%m-%d %H:%M:%S')}")
+    return dict(zip(endpoint_names, results))
+
+
+async def delete_deployed_model_async(endpoint_name, delete_model=True):
+    """Async variant of ``delete_deployed_model`` built on aioboto3.
+
+    Falls back to running ``delete_deployed_model`` in a worker thread when
+    aioboto3 is not installed.
+    """
+    client_context = _aioboto3_client()
+    if client_context is None:
+        return await asyncio.to_thread(delete_deployed_model, endpoint_name, delete_model)
+    
+    async with client_context as sagemaker_client:
+        return await _delete_deployed_model_async(sagemaker_client, endpoint_name, delete_model)
+
+
+def _json_dumps(obj):
+    """Serialize a SageMaker API object to a JSON string."""
+    if orjson is not None:
+        # orjson encodes datetimes natively, without a Python-level callback
+        return orjson.dumps(obj, default=str).decode()
+    
+    import json
+    # Match orjson's output: ISO 8601 datetimes, compact separators, raw UTF-8
+    return json.dumps(
+        obj,
+        default=_json_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def _json_default(value):
+    """Encode values the stdlib JSON encoder does not support."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _print_table(title, header, rows, empty_message):
+    """Print a table, writing rows to stdout in page-sized batches."""
+    lines = []
+    found = False
+    for row in rows:
+        if not found:
+            lines.extend(["", f"{title}:", "=" * 80, header, "-" * 80])
+            found = True
+        lines.append(row)
+        if len(lines) >= LIST_PAGE_SIZE:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines = []
+    
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    if not found:
+        print(empty_message)
+
+
+def print_endpoint_list(endpoints):
+    """Print formatted endpoint information as it is retrieved."""
+    format_row = ENDPOINT_ROW_TEMPLATE.format
+    _print_table(
+        "SageMaker Endpoints",
+        f"{'Endpoint Name':<50} {'Status':<15} {'Created':<20}",
+        (
+            format_row(endpoint["EndpointName"], endpoint["EndpointStatus"], endpoint["CreationTime"])
+            for endpoint in endpoints
+        ),
+        "No endpoints found.",
+    )
+
+
+def print_model_list(models):
+    """Print formatted model information as it is retrieved."""
+    format_row = MODEL_ROW_TEMPLATE.format
+    _print_table(
+        "SageMaker Models",
+        f"{'Model Name':<50} {'Created':<20}",
+        (format_row(model["ModelName"], model["CreationTime"]) for model in models),
+        "No models found.",
+    )
 
 
 def parse_args():
@@ -177,11 +691,18 @@ Examples:
   # List only models:
   python deploy.py list --models-only
   
+  # List endpoints whose name contains a string, filtered by status:
+  python deploy.py list --endpoints-only --name-contains mistral --status InService
+  
   # Delete an endpoint:
   python deploy.py delete --endpoint-name my-endpoint-name
   
   # Delete an endpoint but keep the model:
   python deploy.py delete --endpoint-name my-endpoint-name --keep-model
+  
+  # Show which endpoints start with a prefix, then delete them:
+  python deploy.py delete --endpoint-prefix my-endpoint-
+  python deploy.py delete --endpoint-prefix my-endpoint- --yes
 """
     )
     
@@ -233,27 +754,49 @@ Examples:
         action="store_true",
         help="List only models, not endpoints"
     )
+    list_parser.add_argument(
+        "--name-contains",
+        help="Only list endpoints and models whose name contains this string"
+    )
+    list_parser.add_argument(
+        "--status",
+        choices=ENDPOINT_STATUSES,
+        help="Only list endpoints with this status (does not filter models)"
+    )
     list_parser.add_argument(
         "--json", 
         action="store_true",
-        help="Output raw JSON instead of formatted tables"
+        help="Output newline-delimited JSON instead of formatted tables"
     )
     
     # Delete command
-    delete_parser = subparsers.add_parser("delete", help="Delete a SageMaker endpoint")
-    delete_parser.add_argument(
+    delete_parser = subparsers.add_parser("delete", help="Delete SageMaker endpoints")
+    delete_target = delete_parser.add_mutually_exclusive_group(required=True)
+    delete_target.add_argument(
         "--endpoint-name", 
-        required=True,
         help="Name of the endpoint to delete"
     )
+    delete_target.add_argument(
+        "--endpoint-prefix",
+        help="Delete every endpoint whose name starts with this prefix"
+    )
     delete_parser.add_argument(
         "--keep-model", 
         action="store_false",
         dest="delete_model",
         help="Keep the model when deleting the endpoint"
     )
+    delete_parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Confirm deleting every endpoint matched by --endpoint-prefix (default: only list them)"
+    )
+    
+    args = parser.parse_args()
+    if args.command == "delete" and args.endpoint_prefix is not None and not args.endpoint_prefix:
+        delete_parser.error("--endpoint-prefix must not be empty")
     
-    return parser.parse_args()
+    return args
 
 
 def main():
@@ -266,42 +809,85 @@ def main():
         return 1
     
     if args.command == "deploy":
-        predictor = deploy_model(
-            model_id=args.model_id,
-            model_version=args.model_version,
-            role=args.role,
-            instance_type=args.instance_type,
-            accept_eula=args.accept_eula,
-            wait=args.wait,
-        )
+        try:
+            predictor = deploy_model(
+                model_id=args.model_id,
+                model_version=args.model_version,
+                role=args.role,
+                instance_type=args.instance_type,
+                accept_eula=args.accept_eula,
+                wait=args.wait,
+            )
+        except ValueError as e:
+            print(f"Error: {str(e)}")
+            return 1
         print(f"Successfully initiated deployment of model: {args.model_id}")
         print(f"Endpoint name: {predictor.endpoint_name}")
         
         if not args.wait:
             print("\nDeployment is continuing in the background. You can check status with:")
-            print(f"  python deploy.py list --endpoints-only | grep {predictor.endpoint_name}")
+            print(f"  python deploy.py list --endpoints-only --name-contains {predictor.endpoint_name}")
         else:
             print("\nModel deployment completed successfully.")
         
     elif args.command == "list":
-        models, endpoints = list_deployed_models()
+        endpoint_filters = {"name_contains": args.name_contains, "status_equals": args.status}
+        model_filters = {"name_contains": args.name_contains}
         
         if args.json:
-            import json
+            # Newline-delimited JSON, one object per resource, so output is streamed
             if not args.models_only:
-                print(json.dumps(endpoints, default=str))
+                for endpoint in iter_endpoints(**endpoint_filters):
+                    print(_json_dumps(endpoint))
             if not args.endpoints_only:
-                print(json.dumps(models, default=str))
+                for model in iter_models(**model_filters):
+                    print(_json_dumps(model))
         else:
             if not args.models_only:
-                print_endpoint_list(endpoints)
+                print_endpoint_list(iter_endpoints(**endpoint_filters))
             if not args.endpoints_only:
-                print_model_list(models)
+                print_model_list(iter_models(**model_filters))
                 
+    elif args.command == "delete" and args.endpoint_prefix is not None:
+        endpoint_names = [
+            endpoint["EndpointName"]
+            for endpoint in iter_endpoints(name_contains=args.endpoint_prefix)
+            if endpoint["EndpointName"].startswith(args.endpoint_prefix)
+        ]
+        if not endpoint_names:
+            print(f"No endpoints found with prefix: {args.endpoint_prefix}")
+            return 1
+        
+        print(f"Endpoints matching prefix {args.endpoint_prefix}:")
+        for endpoint_name in endpoint_names:
+            print(f"  {endpoint_name}")
+        if not args.yes:
+            print("\nNo endpoints were deleted. Re-run with --yes to delete them.")
+            return 0
+        
+        results = asyncio.run(
+            delete_deployed_models_async(endpoint_names, delete_model=args.delete_model)
+        )
+        for endpoint_name, result in results.items():
+            if result:
+                print(f"Successfully deleted endpoint: {endpoint_name}")
+            else:
+                print(f"Failed to delete endpoint: {endpoint_name}")
+        
+        if not all(results.values()):
+            return 1
+        
+        if args.delete_model:
+            print("Associated models were also deleted")
+        else:
+            print("Associated models were kept")
+        
     elif args.command == "delete":
-        result = delete_deployed_model(
-            endpoint_name=args.endpoint_name,
-            delete_model=args.delete_model
+        result = asyncio.run(
+            delete_deployed_model_async(
+                endpoint_name=args.endpoint_name,
+                delete_model=args.delete_model
+            )
         )
         if result:
             print(f"Successfully deleted endpoint: {args.endpoint_name}")